@@ -14,8 +14,8 @@ def run_experiment(x, eps, min_samples, title):
     model = DBSCAN(eps=eps, min_samples=min_samples)
     model.fit(x)
 
-    n_clusters = len(set(model.labels_)) - (1 if -1 in model.labels_ else 0)
-    n_noise = list(model.labels_).count(-1)
+    n_clusters = model.cluster_summary_["n_clusters"]
+    n_noise = model.cluster_summary_["n_noise"]
 
     print(f"Found clusters: {n_clusters}")
     print(f"Noise points: {n_noise}")
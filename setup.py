@@ -11,9 +11,7 @@ from setuptools import setup
 
 if __name__ == "__main__":
     try:
-        setup(use_scm_version={"version_scheme": "no-guess-dev"}, install_requires=['numpy', 'scikit-learn',
-                                                                                    'matplotlib', 'importlib-metadata',
-                                                                                    'pytest'])
+        setup(use_scm_version={"version_scheme": "no-guess-dev"})
     except:  # noqa
         print(
             "\n\nAn error occurred while building the project, "
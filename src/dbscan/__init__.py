@@ -1,16 +1,45 @@
-import sys
-
-if sys.version_info[:2] >= (3, 8):
-    # TODO: Import directly (no need for conditional) when `python_requires = >= 3.8`
-    from importlib.metadata import PackageNotFoundError, version  # pragma: no cover
-else:
-    from importlib_metadata import PackageNotFoundError, version  # pragma: no cover
-
-try:
-    # Change here if project is renamed and does not equal the package name
-    dist_name = "DBSCAN"
-    __version__ = version(dist_name)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
-finally:
-    del version, PackageNotFoundError
+"""
+Importing the package loads only NumPy and the core DBSCAN engine.
+Everything else (OPTICS, the asyncio service, plotting, the package
+version) is imported on first attribute access.
+"""
+import importlib
+
+from .dbscan import DBSCAN
+
+__all__ = ["DBSCAN", "OPTICS", "ClusteringService", "fit_many", "plot_clusters"]
+
+# attribute -> submodule it lives in
+_LAZY_ATTRIBUTES = {
+    "OPTICS": "optics",
+    "ClusteringService": "service",
+    "fit_many": "batch",
+    "plot_clusters": "visualization",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name == "__version__":
+        value = _get_version()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_version():
+    # importlib.metadata alone costs more to import than the whole core engine
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover - Python < 3.8
+        from importlib_metadata import PackageNotFoundError, version
+
+    try:
+        # Change here if project is renamed and does not equal the package name
+        return version("DBSCAN")
+    except PackageNotFoundError:  # pragma: no cover
+        return "unknown"
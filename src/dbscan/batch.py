@@ -0,0 +1,232 @@
+import numpy as np
+
+from .validation import check_array
+
+# upper bound (in elements) for any pairwise difference tensor; groups too large
+# for one block are processed in row blocks of this size instead
+BLOCK_ELEMENTS = 1 << 22
+
+
+def fit_many(datasets, eps, min_samples, n_jobs=None, return_core=False,
+             dtype=np.float64):
+    """
+    Clusters many small independent datasets in one call.
+
+    Groups are sorted by size and packed into padded 3D blocks, so the
+    pairwise distances of a whole block come from a single vectorized
+    expression and all of its groups share one labeling pass. The labels
+    are identical to running ``DBSCAN(eps, min_samples).fit(X)`` on every
+    dataset separately.
+
+    Args:
+        datasets (list): Sequence of 2D arrays, one per group.
+        eps (float): Neighborhood radius.
+        min_samples (int): Neighborhood size for a point to be a core point.
+        n_jobs (int): Number of worker processes the blocks are sharded
+                      across. None or 1 runs everything in this process.
+        return_core (bool): Also return a boolean core mask per group.
+        dtype (np.dtype): dtype each dataset is converted to.
+    Returns:
+        list: Labels array per group, in input order (and a list of core
+              masks if ``return_core`` is set).
+    """
+    datasets = [check_array(X, dtype=dtype)[0] for X in datasets]
+
+    chunks = _plan_chunks(datasets)
+    args = [([datasets[k] for k in chunk], eps, min_samples) for chunk in chunks]
+
+    if n_jobs is not None and n_jobs > 1 and len(chunks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_fit_block_args, args))
+    else:
+        results = [_fit_block(*a) for a in args]
+
+    labels = [None] * len(datasets)
+    core_masks = [None] * len(datasets)
+    for chunk, (chunk_labels, chunk_core) in zip(chunks, results):
+        for k, group_labels, group_core in zip(chunk, chunk_labels, chunk_core):
+            labels[k] = group_labels
+            core_masks[k] = group_core
+
+    if return_core:
+        return labels, core_masks
+    return labels
+
+
+def _plan_chunks(datasets):
+    """
+    Splits group indices into blocks of similar size whose padded
+    pairwise difference tensor stays below ``BLOCK_ELEMENTS``.
+    """
+    sizes = np.array([len(X) for X in datasets], dtype=np.int64)
+    order = np.argsort(sizes, kind="stable")
+
+    chunks = []
+    current = []
+    for k in order:
+        n_max = max(sizes[k], 1)
+        dim = max(datasets[k].shape[1], 1)
+        # sizes are ascending, so the newest group sets the padding of the block
+        if current and (len(current) + 1) * n_max * n_max * dim > BLOCK_ELEMENTS:
+            chunks.append(current)
+            current = []
+        current.append(int(k))
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _fit_block_args(args):
+    return _fit_block(*args)
+
+
+def _fit_block(groups, eps, min_samples):
+    """
+    Labels a block of groups that share the same dimensionality.
+
+    Returns:
+        tuple: (list of labels arrays, list of core masks)
+    """
+    sizes = np.array([len(X) for X in groups], dtype=np.int64)
+    n_groups = len(groups)
+    n_max = int(sizes.max()) if n_groups else 0
+    if n_max == 0:
+        return ([np.full(0, -1) for _ in groups],
+                [np.zeros(0, dtype=bool) for _ in groups])
+
+    dims = {X.shape[1] for X in groups if len(X)}
+    if len(dims) > 1:
+        # mixed dimensionality cannot share one padded tensor
+        results = [_fit_block([X], eps, min_samples) for X in groups]
+        return [r[0][0] for r in results], [r[1][0] for r in results]
+    dim = dims.pop()
+    if n_max * n_max * dim > BLOCK_ELEMENTS:
+        # only a single group is ever planned into a block this large
+        labels, core = _fit_large(groups[0], eps, min_samples)
+        return [labels], [core]
+
+    # padding rows are NaN so they are never within eps of anything
+    dtype = np.result_type(groups[0].dtype, np.float32)
+    batch = np.full((n_groups, n_max, dim), np.nan, dtype=dtype)
+    valid = np.arange(n_max) < sizes[:, None]
+    batch[valid] = np.concatenate([X for X in groups if len(X)])
+
+    # same arithmetic as utils.euclidean_distance, for all pairs of every group
+    diff = batch[:, :, None, :] - batch[:, None, :, :]
+    with np.errstate(invalid="ignore"):
+        # squared in place, so the block holds a single difference tensor
+        adjacency = np.sqrt(np.sum(np.square(diff, out=diff), axis=-1)) <= eps
+    del diff
+
+    # padding has no neighbors but would still pass min_samples <= 0
+    core = (adjacency.sum(axis=-1) >= min_samples) & valid
+    labels = _label_block(adjacency, core)
+
+    return ([labels[k, :n] for k, n in enumerate(sizes)],
+            [core[k, :n] for k, n in enumerate(sizes)])
+
+
+def _fit_large(X, eps, min_samples):
+    """
+    Labels one group too large for a full pairwise tensor, computing
+    distances in row blocks of at most ``BLOCK_ELEMENTS`` differences.
+
+    Clusters are grown breadth-first from the lowest unlabeled core point,
+    one whole frontier of core points per step, so cluster numbering and
+    border assignment are the same as in ``DBSCAN.fit``.
+
+    Returns:
+        tuple: (labels array, core mask)
+    """
+    n_samples, dim = X.shape
+    step = max(1, BLOCK_ELEMENTS // (n_samples * max(dim, 1)))
+
+    def adjacency(rows):
+        # same arithmetic as utils.euclidean_distance
+        diff = X[rows, None, :] - X[None, :, :]
+        return np.sqrt(np.sum(np.square(diff, out=diff), axis=-1)) <= eps
+
+    core = np.zeros(n_samples, dtype=bool)
+    for start in range(0, n_samples, step):
+        rows = np.arange(start, min(start + step, n_samples))
+        core[rows] = adjacency(rows).sum(axis=1) >= min_samples
+
+    labels = np.full(n_samples, -1, dtype=np.int64)
+    cluster_id = 0
+    for seed in np.flatnonzero(core):
+        if labels[seed] != -1:
+            continue
+        labels[seed] = cluster_id
+        frontier = np.array([seed])
+        while frontier.size:
+            reached = []
+            for start in range(0, len(frontier), step):
+                touched = adjacency(frontier[start:start + step]).any(axis=0)
+                new = touched & (labels == -1)
+                labels[new] = cluster_id
+                reached.append(np.flatnonzero(new & core))
+            frontier = np.concatenate(reached)
+        cluster_id += 1
+
+    return labels, core
+
+
+def _label_block(adjacency, core):
+    """
+    Assigns DBSCAN labels from the neighborhood graph of a padded block.
+
+    Clusters are the connected components of core points, numbered within
+    each group in order of their lowest core index; border points join the
+    lowest numbered adjacent cluster. This is exactly what the sequential
+    expansion in ``DBSCAN.fit`` produces.
+    """
+    n_groups, n_max = core.shape
+    flat_core = core.ravel()
+
+    group, src, dst = np.nonzero(adjacency & core[:, None, :])
+    src = group * n_max + src
+    dst = group * n_max + dst
+
+    from_core = flat_core[src]
+    roots = _component_roots(n_groups * n_max, src[from_core], dst[from_core])
+
+    core_nodes = np.flatnonzero(flat_core)
+    unique_roots, cluster = np.unique(roots[core_nodes], return_inverse=True)
+    # renumber clusters so every group starts again at 0
+    group_start = np.searchsorted(unique_roots, np.arange(n_groups) * n_max)
+    cluster = cluster - group_start[core_nodes // n_max]
+
+    labels = np.full(n_groups * n_max, -1, dtype=np.int64)
+    labels[core_nodes] = cluster
+
+    border_src = src[~from_core]
+    border_dst = dst[~from_core]
+    border = np.full(n_groups * n_max, np.iinfo(np.int64).max)
+    np.minimum.at(border, border_src, labels[border_dst])
+    has_cluster = border != np.iinfo(np.int64).max
+    labels[has_cluster] = border[has_cluster]
+
+    return labels.reshape(n_groups, n_max)
+
+
+def _component_roots(n_nodes, src, dst):
+    """
+    Connected components by min-label propagation with pointer jumping.
+
+    Args:
+        n_nodes (int): Number of nodes.
+        src (np.array): Edge sources (the edge list must be symmetric).
+        dst (np.array): Edge targets.
+    Returns:
+        np.array: For every node, the smallest node index in its component.
+    """
+    roots = np.arange(n_nodes)
+    while True:
+        new_roots = roots.copy()
+        np.minimum.at(new_roots, src, roots[dst])
+        new_roots = new_roots[new_roots]
+        if np.array_equal(new_roots, roots):
+            return roots
+        roots = new_roots
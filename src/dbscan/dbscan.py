@@ -1,5 +1,10 @@
+import contextlib
+
 import numpy as np
+from .batch import BLOCK_ELEMENTS, fit_many as batch_fit_many
+from .summary import cluster_summary
 from .utils import euclidean_distance
+from .validation import check_array
 
 
 class DBSCAN:
@@ -7,16 +12,18 @@ class DBSCAN:
     Density-Based Spatial Clustering of Applications with Noise.
     """
 
-    def __init__(self, eps, min_samples):
+    def __init__(self, eps, min_samples, dtype=np.float64):
         """
         Args:
             eps (float): The maximum distance between two samples for one to be considered
                          as in the neighborhood of the other.
             min_samples (int): The number of samples (or total weight) in a neighborhood
                                for a point to be considered as a core point.
+            dtype (np.dtype): dtype the input data is converted to before fitting.
         """
         self.eps = eps
         self.min_samples = min_samples
+        self.dtype = dtype
         self.labels_ = []
 
     def fit(self, X):
@@ -24,37 +31,172 @@ class DBSCAN:
         Perform DBSCAN clustering from vector array.
 
         Args:
-            X (np.array): Input data (points).
+            X (array-like): Input data (points). Arrays, memmaps, buffers and
+                            pandas DataFrames are accepted; they are converted
+                            to a C-contiguous array at most once, and
+                            ``input_copied_`` tells whether that needed a copy.
         Returns:
             self
         """
-        n_samples = len(X)
-        # Initialize all labels to -1 (Noise) by default
-        self.labels_ = np.full(n_samples, -1)
+        with self._phase("validate"):
+            X, self.input_copied_ = check_array(X, dtype=self.dtype)
 
-        cluster_id = 0
-        visited = np.full(n_samples, False)
+        with self._phase("cluster"):
+            n_samples = len(X)
+            # Initialize all labels to -1 (Noise) by default
+            self.labels_ = np.full(n_samples, -1)
 
-        for i in range(n_samples):
-            if visited[i]:
-                continue
+            cluster_id = 0
+            visited = np.full(n_samples, False)
+            # every point is visited exactly once, so this records core status as we go
+            core_mask = np.full(n_samples, False)
 
-            visited[i] = True
+            for i in range(n_samples):
+                if visited[i]:
+                    continue
 
-            neighbors = self._get_neighbors(X, i)
+                visited[i] = True
 
-            if len(neighbors) < self.min_samples:
-                # if not enough neighbors, label as Noise (-1).
-                # Note: It might be revisited later and included in a cluster
-                # if it's a border point of another cluster.
-                self.labels_[i] = -1
-            else:
-                # Found a core point -> Start a new cluster
-                self._expand_cluster(X, i, neighbors, cluster_id, visited)
-                cluster_id += 1
+                neighbors = self._get_neighbors(X, i)
+                core_mask[i] = len(neighbors) >= self.min_samples
+
+                if len(neighbors) < self.min_samples:
+                    # if not enough neighbors, label as Noise (-1).
+                    # Note: It might be revisited later and included in a cluster
+                    # if it's a border point of another cluster.
+                    self.labels_[i] = -1
+                else:
+                    # Found a core point -> Start a new cluster
+                    self._expand_cluster(X, i, neighbors, cluster_id, visited,
+                                         core_mask)
+                    cluster_id += 1
+
+        with self._phase("summarize"):
+            self.core_sample_indices_ = np.flatnonzero(core_mask)
+            self.components_ = X[self.core_sample_indices_]
+            self.cluster_summary_ = cluster_summary(X, self.labels_, core_mask)
 
         return self
 
+    def fit_many(self, datasets, n_jobs=None):
+        """
+        Clusters many small independent datasets with this model's parameters
+        (see :func:`dbscan.batch.fit_many`). The model itself is left untouched.
+
+        Args:
+            datasets (list): Sequence of 2D arrays, one per group.
+            n_jobs (int): Number of worker processes to shard the groups across.
+        Returns:
+            list: Labels array per group, same as calling fit() on each one.
+        """
+        return batch_fit_many(datasets, self.eps, self.min_samples, n_jobs=n_jobs,
+                              dtype=self.dtype)
+
+    def predict(self, X):
+        """
+        Assigns new points to the cluster of their nearest core sample if it
+        lies within eps, otherwise labels them as Noise (-1). The fitted
+        model is not changed.
+
+        Args:
+            X (array-like): New points.
+        Returns:
+            np.array: Cluster label per point.
+        """
+        if not hasattr(self, "components_"):
+            raise ValueError("DBSCAN instance is not fitted yet, call fit() first")
+
+        X, _ = check_array(X, dtype=self.dtype)
+        if X.shape[1] != self.components_.shape[1]:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but DBSCAN was fitted with "
+                f"{self.components_.shape[1]}"
+            )
+        labels = np.full(len(X), -1)
+        n_core = len(self.components_)
+        if n_core == 0:
+            return labels
+
+        core_labels = self.labels_[self.core_sample_indices_]
+        # bound the (rows, cores, features) difference tensor of one step
+        step = max(1, BLOCK_ELEMENTS // (n_core * max(X.shape[1], 1)))
+        for start in range(0, len(X), step):
+            diff = X[start:start + step, None, :] - self.components_[None, :, :]
+            dist = np.sqrt(np.sum(diff ** 2, axis=-1))
+            nearest = np.argmin(dist, axis=1)
+            within = dist[np.arange(len(nearest)), nearest] <= self.eps
+            labels[start:start + step][within] = core_labels[nearest[within]]
+
+        return labels
+
+    def save(self, path):
+        """
+        Saves the fitted model to a directory (see :mod:`dbscan.persistence`).
+
+        Args:
+            path (str): Target directory.
+        """
+        if not hasattr(self, "components_"):
+            raise ValueError("DBSCAN instance is not fitted yet, call fit() first")
+
+        arrays = {
+            "labels": self.labels_,
+            "core_sample_indices": self.core_sample_indices_,
+            "components": self.components_,
+        }
+        # NumPy scalars are not JSON serializable
+        params = {"eps": float(self.eps), "min_samples": int(self.min_samples),
+                  "dtype": np.dtype(self.dtype).str}
+        # the summary is stored too, so dashboards can read it off a loaded model
+        for key, value in self.cluster_summary_.items():
+            if isinstance(value, np.ndarray):
+                arrays[f"summary_{key}"] = value
+            else:
+                params[f"summary_{key}"] = value
+
+        # imported here, a fit-only worker never needs json/shutil/tempfile
+        from .persistence import save_arrays
+
+        save_arrays(path, "DBSCAN", arrays, params)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Restores a model written by :meth:`save` without refitting.
+
+        Args:
+            path (str): Directory the model was saved to.
+            mmap (bool): Memory-map the arrays read-only instead of reading
+                         them into memory.
+        Returns:
+            DBSCAN: The fitted model.
+        """
+        from .persistence import load_arrays
+
+        params, arrays = load_arrays(path, "DBSCAN", mmap=mmap)
+
+        model = cls(eps=params["eps"], min_samples=params["min_samples"],
+                    dtype=np.dtype(params["dtype"]))
+        model.labels_ = arrays["labels"]
+        model.core_sample_indices_ = arrays["core_sample_indices"]
+        model.components_ = arrays["components"]
+        model.cluster_summary_ = {
+            name[len("summary_"):]: value
+            for source in (params, arrays)
+            for name, value in source.items() if name.startswith("summary_")
+        }
+        return model
+
+    def _phase(self, name):
+        """
+        Marks a named phase of :meth:`fit`. A no-op unless a
+        :class:`dbscan.profiling.FitProfiler` replaced it on this instance.
+
+        Args:
+            name (str): Name of the phase in the profiler's report.
+        """
+        return contextlib.nullcontext()
+
     def _get_neighbors(self, X, point_idx):
         """
         Finds indices of neighbors within epsilon distance.
@@ -66,16 +208,17 @@ class DBSCAN:
             list: Indices of neighbors.
         """
         neighbors = []
+        center = X[point_idx]
 
         for i, point in enumerate(X):
             # Calculate distance using our utility function
-            dist = euclidean_distance(X[point_idx], point)
+            dist = euclidean_distance(center, point)
 
             if dist <= self.eps:
                 neighbors.append(i)
         return neighbors
 
-    def _expand_cluster(self, X, point_idx, neighbors, cluster_id, visited):
+    def _expand_cluster(self, X, point_idx, neighbors, cluster_id, visited, core_mask):
         """
         Recursively expands the cluster from a starting core point.
 
@@ -85,6 +228,7 @@ class DBSCAN:
             neighbors (list): Neighbors of the seed point.
             cluster_id (int): ID of the current cluster.
             visited (np.array): Boolean array tracking visited points.
+            core_mask (np.array): Boolean array marking core points found so far.
         """
         # assign the seed point to the current cluster
         self.labels_[point_idx] = cluster_id
@@ -103,6 +247,7 @@ class DBSCAN:
 
                 # if this neighbor is also a core point add its neighbors to the queue
                 if len(new_neighbors) >= self.min_samples:
+                    core_mask[neighbor_point_idx] = True
                     neighbors = neighbors + new_neighbors
 
             # if the point was previously labeled as Noise (-1) or not labeled yet
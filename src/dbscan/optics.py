@@ -0,0 +1,184 @@
+import heapq
+
+import numpy as np
+
+from .persistence import load_arrays, save_arrays
+from .utils import euclidean_distances_to
+from .validation import check_array
+
+
+class OPTICS:
+    """
+    Ordering Points To Identify the Clustering Structure.
+
+    One fit computes core distances and a reachability ordering for every
+    eps up to ``max_eps``; DBSCAN labelings for any of those eps are then
+    extracted in O(N) with :meth:`extract_dbscan`, without touching the
+    data again.
+    """
+
+    def __init__(self, min_samples, max_eps=np.inf, dtype=np.float64):
+        """
+        Args:
+            min_samples (int): The number of samples in a neighborhood for a
+                               point to be considered as a core point (same
+                               meaning as in DBSCAN).
+            max_eps (float): Largest eps that can be extracted later. The
+                             full distance row of every point is computed
+                             regardless; smaller values only shrink the
+                             seed heap.
+            dtype (np.dtype): dtype the input data is converted to before fitting.
+        """
+        self.min_samples = min_samples
+        self.max_eps = max_eps
+        self.dtype = dtype
+
+    def fit(self, X):
+        """
+        Computes the reachability ordering of X.
+
+        Seeds are kept in a heap keyed by reachability distance; stale heap
+        entries are skipped when popped instead of being updated in place.
+
+        Args:
+            X (array-like): Input data (points).
+        Returns:
+            self
+        """
+        X, _ = check_array(X, dtype=self.dtype)
+        n_samples = len(X)
+
+        self.core_distances_ = np.full(n_samples, np.inf)
+        self.reachability_ = np.full(n_samples, np.inf)
+        self.predecessor_ = np.full(n_samples, -1)
+        # smallest reachability from *any* core point, used to recover border
+        # points that were ordered before all of their core neighbors
+        self.border_reachability_ = np.full(n_samples, np.inf)
+        self.border_predecessor_ = np.full(n_samples, -1)
+        self.ordering_ = np.empty(n_samples, dtype=np.int64)
+
+        processed = np.full(n_samples, False)
+        position = 0
+
+        for start in range(n_samples):
+            if processed[start]:
+                continue
+
+            seeds = [(np.inf, start)]
+            while seeds:
+                _, point_idx = heapq.heappop(seeds)
+                if processed[point_idx]:
+                    continue
+
+                processed[point_idx] = True
+                self.ordering_[position] = point_idx
+                position += 1
+
+                dist = euclidean_distances_to(X, X[point_idx])
+                neighbors = np.flatnonzero(dist <= self.max_eps)
+                if len(neighbors) < self.min_samples:
+                    continue
+
+                # distance to the min_samples-th nearest neighbor (itself included)
+                core_distance = np.partition(dist[neighbors], self.min_samples - 1)[
+                    self.min_samples - 1]
+                self.core_distances_[point_idx] = core_distance
+
+                reach = np.maximum(core_distance, dist[neighbors])
+                better = reach < self.border_reachability_[neighbors]
+                self.border_reachability_[neighbors[better]] = reach[better]
+                self.border_predecessor_[neighbors[better]] = point_idx
+
+                open_seeds = ~processed[neighbors]
+                candidates = neighbors[open_seeds]
+                reach = reach[open_seeds]
+                better = reach < self.reachability_[candidates]
+                candidates = candidates[better]
+                reach = reach[better]
+                self.reachability_[candidates] = reach
+                self.predecessor_[candidates] = point_idx
+                for r, idx in zip(reach.tolist(), candidates.tolist()):
+                    heapq.heappush(seeds, (r, idx))
+
+        return self
+
+    def extract_dbscan(self, eps):
+        """
+        DBSCAN labels for the given eps, read off the reachability plot in O(N).
+
+        Core points get exactly the clusters DBSCAN(eps, min_samples) finds;
+        a border point reachable from several clusters may end up in a
+        different one of them than DBSCAN picks. Core points are those with
+        ``core_distances_ <= eps``.
+
+        Args:
+            eps (float): Neighborhood radius, at most ``max_eps``.
+        Returns:
+            np.array: Cluster label per point, -1 for noise.
+        """
+        if not hasattr(self, "ordering_"):
+            raise ValueError("OPTICS instance is not fitted yet, call fit() first")
+        if eps > self.max_eps:
+            raise ValueError(f"eps={eps} is larger than max_eps={self.max_eps}")
+
+        reach = self.reachability_[self.ordering_]
+        core = self.core_distances_[self.ordering_] <= eps
+        far = reach > eps
+
+        # a new cluster starts at every core point not reachable from the previous ones
+        ordered_labels = np.cumsum(far & core) - 1
+        ordered_labels[far & ~core] = -1
+
+        labels = np.empty(len(ordered_labels), dtype=np.int64)
+        labels[self.ordering_] = ordered_labels
+
+        border = ((labels == -1) & (self.core_distances_ > eps)
+                  & (self.border_reachability_ <= eps))
+        labels[border] = labels[self.border_predecessor_[border]]
+        return labels
+
+    def save(self, path):
+        """
+        Saves the reachability plot so it can be cached and shared between
+        processes (see :mod:`dbscan.persistence`).
+
+        Args:
+            path (str): Target directory.
+        """
+        if not hasattr(self, "ordering_"):
+            raise ValueError("OPTICS instance is not fitted yet, call fit() first")
+
+        save_arrays(
+            path,
+            "OPTICS",
+            {
+                "ordering": self.ordering_,
+                "core_distances": self.core_distances_,
+                "reachability": self.reachability_,
+                "predecessor": self.predecessor_,
+                "border_reachability": self.border_reachability_,
+                "border_predecessor": self.border_predecessor_,
+            },
+            {"min_samples": int(self.min_samples), "max_eps": float(self.max_eps),
+             "dtype": np.dtype(self.dtype).str},
+        )
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Restores a reachability plot written by :meth:`save`.
+
+        Args:
+            path (str): Directory the model was saved to.
+            mmap (bool): Memory-map the arrays read-only instead of reading
+                         them into memory.
+        Returns:
+            OPTICS: The fitted model.
+        """
+        params, arrays = load_arrays(path, "OPTICS", mmap=mmap)
+
+        model = cls(min_samples=params["min_samples"], max_eps=params["max_eps"],
+                    dtype=np.dtype(params["dtype"]))
+        for name, array in arrays.items():
+            setattr(model, f"{name}_", array)
+        return model
@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+FORMAT_VERSION = 1
+META_FILENAME = "meta.json"
+# symlink to the version directory that holds the current arrays
+CURRENT_LINK = "current"
+
+
+def save_arrays(path, kind, arrays, params):
+    """
+    Writes a fitted model to a directory as one ``.npy`` file per array
+    plus a small JSON header.
+
+    Plain ``.npy`` files (instead of a single ``.npz`` archive) are used on
+    purpose: they can be memory-mapped on reload, so several processes
+    reading the same model share the page cache instead of each holding
+    its own copy.
+
+    Every save writes a new version subdirectory and then swaps the
+    ``current`` symlink to it with a single rename, so a reader always sees
+    either the old or the new model, never a mix. The previous version is
+    kept until the next save, so readers that resolved it just before the
+    swap can still open its files; processes that have it mapped keep
+    their pages even after it is deleted.
+
+    Args:
+        path (str): Target directory. It must not exist yet, be empty, or
+                    hold a model saved by this function.
+        kind (str): Name of the model class, checked again on load.
+        arrays (dict): Mapping of array name to np.array.
+        params (dict): JSON-serializable constructor parameters.
+    """
+    path = os.path.abspath(os.fspath(path))
+    link = os.path.join(path, CURRENT_LINK)
+    if os.path.lexists(path):
+        if not os.path.isdir(path) or (os.listdir(path) and not _is_model_dir(path)):
+            raise ValueError(
+                f"{path} exists and does not hold a saved model, refusing to "
+                "replace it"
+            )
+    os.makedirs(path, exist_ok=True)
+    previous = os.readlink(link) if os.path.islink(link) else None
+
+    version_path = tempfile.mkdtemp(prefix="v-", dir=path)
+    # mkdtemp creates the directory private to this user; a model is meant to be shared
+    os.chmod(version_path, 0o755)
+    tmp_link = os.path.join(path, f".{CURRENT_LINK}.tmp-{os.getpid()}")
+    try:
+        _write_arrays(version_path, kind, arrays, params)
+        if os.path.lexists(tmp_link):
+            os.remove(tmp_link)
+        # relative target, so the model directory can be moved as a whole
+        os.symlink(os.path.basename(version_path), tmp_link)
+        os.replace(tmp_link, link)
+    except BaseException:
+        shutil.rmtree(version_path, ignore_errors=True)
+        if os.path.lexists(tmp_link):
+            os.remove(tmp_link)
+        raise
+
+    keep = {os.path.basename(version_path), previous}
+    for name in os.listdir(path):
+        if name.startswith("v-") and name not in keep:
+            shutil.rmtree(os.path.join(path, name), ignore_errors=True)
+
+
+def _is_model_dir(path):
+    try:
+        with open(os.path.join(path, CURRENT_LINK, META_FILENAME),
+                  encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(meta, dict) and meta.get("format_version") == FORMAT_VERSION
+
+
+def _write_arrays(path, kind, arrays, params):
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "kind": kind,
+        "params": params,
+        "arrays": sorted(arrays),
+    }
+    with open(os.path.join(path, META_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+
+def load_arrays(path, kind, mmap=True):
+    """
+    Reads a directory written by :func:`save_arrays`.
+
+    Args:
+        path (str): Directory the model was saved to.
+        kind (str): Expected model class name.
+        mmap (bool): If True the arrays are memory-mapped read-only
+                     instead of being read into memory.
+    Returns:
+        tuple: (params dict, dict of arrays)
+    """
+    # resolve the link once, so all files come from the same version
+    path = os.path.realpath(os.path.join(path, CURRENT_LINK))
+    with open(os.path.join(path, META_FILENAME), encoding="utf-8") as f:
+        meta = json.load(f)
+
+    version = meta.get("format_version")
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported format version {version!r} (expected {FORMAT_VERSION})"
+        )
+    if meta.get("kind") != kind:
+        raise ValueError(f"Saved model is a {meta.get('kind')!r}, not a {kind!r}")
+
+    mmap_mode = "r" if mmap else None
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in meta["arrays"]
+    }
+    return meta["params"], arrays
@@ -0,0 +1,283 @@
+"""
+Memory and allocation profiling for ``DBSCAN.fit``.
+
+Per neighbor query only the transient peak (tracemalloc) and the number
+of memory blocks still held after the query (a net
+``sys.getallocatedblocks()`` delta) are recorded. Neither the interpreter
+nor tracemalloc counts allocations, so the number of temporaries a query
+creates and frees again is not available.
+
+Only the standard library is imported here, so the module can also be
+loaded standalone to profile older revisions of the package that do not
+ship it (see ``tests/run_memory_profile.py``).
+"""
+import contextlib
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def peak_rss_kb():
+    """
+    Returns:
+        int: Peak resident set size over the whole lifetime of this process
+             in KiB, or None if the platform does not report it.
+    """
+    if resource is None:  # pragma: no cover
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+class FitProfiler:
+    """
+    Records tracemalloc snapshots per fit phase and the memory behaviour of
+    every neighbor query: its transient peak and the number of memory
+    blocks it still holds once it has returned.
+    """
+
+    def __init__(self, top=10):
+        """
+        Args:
+            top (int): Number of allocation sites listed per phase.
+        """
+        self.top = top
+        self.reports = []
+        self._phases = []
+        self._open = []
+        self._queries = []
+        self._observed_peak = 0
+
+    def profile_fit(self, model, X, label=None):
+        """
+        Runs ``model.fit(X)`` under tracemalloc.
+
+        Args:
+            model: A DBSCAN instance (any object with ``fit`` works; neighbor
+                   queries are recorded if it has ``_get_neighbors`` and
+                   phases if it has ``_phase``).
+            X (np.array): Input data.
+            label (str): Name of the run in the report.
+        Returns:
+            dict: The report, also appended to ``self.reports``.
+        """
+        self._phases = []
+        self._open = []
+        self._queries = []
+        original_query = getattr(model, "_get_neighbors", None)
+        if original_query is not None:
+            model._get_neighbors = self._wrap_query(original_query)
+        has_phases = hasattr(model, "_phase")
+        if has_phases:
+            model._phase = self._phase
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        rss_before = peak_rss_kb()
+        try:
+            self._begin_phase("fit")
+            start = time.perf_counter()
+            model.fit(X)
+            wall_time = time.perf_counter() - start
+            self._end_phase()
+            rss_after = peak_rss_kb()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+            if original_query is not None:
+                del model._get_neighbors
+            if has_phases:
+                del model._phase
+
+        # the outer "fit" phase closes last; report it as the total
+        total = self._phases.pop()
+        report = {
+            "label": label or type(model).__name__,
+            "wall_time": wall_time,
+            "allocated": total["allocated"],
+            "peak": total["peak"],
+            "phases": self._phases,
+            "queries": _summarize_queries(self._queries),
+            # the process-wide peak only moves if the fit exceeds it
+            "peak_rss_growth_kb": (None if rss_before is None
+                                   else rss_after - rss_before),
+        }
+        self.reports.append(report)
+        return report
+
+    def _wrap_query(self, query):
+        def profiled_query(*args, **kwargs):
+            current, _ = tracemalloc.get_traced_memory()
+            self._remember_peak()
+            tracemalloc.reset_peak()
+            blocks_before = sys.getallocatedblocks()
+
+            result = query(*args, **kwargs)
+
+            _, peak = tracemalloc.get_traced_memory()
+            self._observed_peak = max(self._observed_peak, peak)
+            # a net figure: blocks freed again before returning do not count
+            retained = sys.getallocatedblocks() - blocks_before
+            self._queries.append((peak - current, retained))
+            return result
+
+        return profiled_query
+
+    def _remember_peak(self):
+        _, peak = tracemalloc.get_traced_memory()
+        self._observed_peak = max(self._observed_peak, peak)
+
+    @contextlib.contextmanager
+    def _phase(self, name):
+        # installed as model._phase for the duration of profile_fit
+        self._begin_phase(name)
+        try:
+            yield
+        finally:
+            self._end_phase()
+
+    def _begin_phase(self, name):
+        self._remember_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        self._open.append({
+            "name": name,
+            "start": time.perf_counter(),
+            "current": current,
+            "peak_before": self._observed_peak,
+            "snapshot": _take_snapshot(),
+        })
+        tracemalloc.reset_peak()
+        self._observed_peak = 0
+
+    def _end_phase(self):
+        opened = self._open.pop()
+        elapsed = time.perf_counter() - opened["start"]
+        self._remember_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        stats = _take_snapshot().compare_to(opened["snapshot"], "lineno")
+
+        self._phases.append({
+            "name": opened["name"],
+            "time": elapsed,
+            "allocated": current - opened["current"],
+            "peak": self._observed_peak - opened["current"],
+            "top": [
+                {"where": str(stat.traceback[0]), "size": stat.size_diff,
+                 "count": stat.count_diff}
+                for stat in stats[:self.top] if stat.size_diff or stat.count_diff
+            ],
+        })
+        # the enclosing phase must still see this phase's peak
+        self._observed_peak = max(self._observed_peak, opened["peak_before"])
+
+
+def _take_snapshot():
+    # hide the profiler's own bookkeeping from the allocation sites
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, contextlib.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+
+
+def _summarize_queries(queries):
+    if not queries:
+        return {"count": 0}
+    peaks = [peak for peak, _ in queries]
+    retained = [n for _, n in queries]
+    return {
+        "count": len(queries),
+        "mean_peak": sum(peaks) / len(peaks),
+        "max_peak": max(peaks),
+        "mean_retained_blocks": sum(retained) / len(retained),
+        "max_retained_blocks": max(retained),
+    }
+
+
+def format_report(report):
+    """
+    Args:
+        report (dict): Report returned by :meth:`FitProfiler.profile_fit`.
+    Returns:
+        str: Human readable summary.
+    """
+    lines = [
+        f"--- Memory profile: {report['label']} ---",
+        f"wall time: {report['wall_time']:.4f} s, "
+        f"allocated: {_kib(report['allocated'])}, peak: {_kib(report['peak'])}, "
+        f"peak RSS growth: {_fmt(report.get('peak_rss_growth_kb'))} KiB",
+    ]
+    for record in report["phases"]:
+        lines.append(f"[{record['name']}] {record['time']:.4f} s, "
+                     f"allocated {_kib(record['allocated'])}, "
+                     f"peak {_kib(record['peak'])}")
+        for site in record["top"]:
+            lines.append(f"    {site['where']}: {_kib(site['size'])} "
+                         f"in {site['count']} blocks")
+    queries = report["queries"]
+    if queries["count"]:
+        lines.append(f"neighbor queries: {queries['count']}, "
+                     f"peak per query {_kib(queries['mean_peak'])} "
+                     f"(max {_kib(queries['max_peak'])}), "
+                     f"blocks still held after a query "
+                     f"{queries['mean_retained_blocks']:.1f} "
+                     f"(max {queries['max_retained_blocks']})")
+    return "\n".join(lines)
+
+
+def compare_reports(a, b):
+    """
+    Side-by-side comparison of two reports, e.g. two git revisions or two
+    sets of DBSCAN options.
+
+    Args:
+        a (dict): Baseline report.
+        b (dict): Candidate report.
+    Returns:
+        str: Markdown-style table with the candidate/baseline ratio.
+    """
+    rows = [
+        ("wall time (s)", a["wall_time"], b["wall_time"]),
+        ("allocated (KiB)", a["allocated"] / 1024, b["allocated"] / 1024),
+        ("peak (KiB)", a["peak"] / 1024, b["peak"] / 1024),
+        # reports of older profilers may not have it
+        ("peak RSS growth (KiB)", a.get("peak_rss_growth_kb"),
+         b.get("peak_rss_growth_kb")),
+        ("queries", a["queries"]["count"], b["queries"]["count"]),
+        ("peak per query (KiB)", a["queries"].get("mean_peak", 0) / 1024,
+         b["queries"].get("mean_peak", 0) / 1024),
+        ("blocks held after query", a["queries"].get("mean_retained_blocks", 0),
+         b["queries"].get("mean_retained_blocks", 0)),
+    ]
+    phases_b = {record["name"]: record for record in b["phases"]}
+    for record in a["phases"]:
+        other = phases_b.get(record["name"])
+        if other is not None:
+            rows.append((f"{record['name']} peak (KiB)", record["peak"] / 1024,
+                         other["peak"] / 1024))
+
+    lines = [
+        f"| Metric | {a['label']} | {b['label']} | Ratio |",
+        "|---|---|---|---|",
+    ]
+    for name, value_a, value_b in rows:
+        ratio = f"{value_b / value_a:.2f}x" if value_a and value_b is not None else "-"
+        lines.append(f"| {name} | {_fmt(value_a)} | {_fmt(value_b)} | {ratio} |")
+    return "\n".join(lines)
+
+
+def _kib(n_bytes):
+    return f"{n_bytes / 1024:.1f} KiB"
+
+
+def _fmt(value):
+    if value is None:
+        return "-"
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
@@ -0,0 +1,282 @@
+"""
+asyncio front-end for serving DBSCAN from an event loop.
+
+Fits and predictions run in a bounded thread or process pool, so the
+event loop is never blocked. Concurrent ``predict_async`` calls are
+coalesced into one vectorized ``DBSCAN.predict`` per batch.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from .dbscan import DBSCAN
+from .validation import check_array
+
+# fitted model of a pool worker process, set once by _init_worker
+_worker_model = None
+
+
+def _init_worker(model):
+    global _worker_model
+    _worker_model = _resolve_model(model)
+
+
+def _worker_predict(X):
+    return _worker_model.predict(X)
+
+
+def _fit(eps, min_samples, X):
+    return DBSCAN(eps=eps, min_samples=min_samples).fit(X)
+
+
+def _resolve_model(model):
+    # a saved model directory is memory-mapped, so all workers share its pages
+    if isinstance(model, (str, os.PathLike)):
+        return DBSCAN.load(model, mmap=True)
+    return model
+
+
+class ClusteringService:
+    """
+    Serves ``cluster_async`` (small fits) and ``predict_async`` requests.
+
+    Use it as an async context manager::
+
+        async with ClusteringService(model, max_workers=4) as service:
+            labels = await service.predict_async(points)
+    """
+
+    def __init__(self, model=None, max_workers=4, use_processes=False,
+                 max_batch_size=4096, max_delay=0.002, max_pending=1024,
+                 eps=0.5, min_samples=5):
+        """
+        Args:
+            model (DBSCAN or str): Fitted model used by predict_async, or the
+                                   directory it was saved to with save().
+            max_workers (int): Size of the worker pool.
+            use_processes (bool): Use a process pool instead of threads.
+            max_batch_size (int): Rows after which a batch is sent without
+                                  waiting for max_delay.
+            max_delay (float): Seconds a request may wait for others to join
+                               its batch.
+            max_pending (int): Requests admitted at once; further callers wait
+                               (back-pressure).
+            eps (float): Default eps for cluster_async.
+            min_samples (int): Default min_samples for cluster_async.
+        """
+        self.max_workers = max_workers
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.eps = eps
+        self.min_samples = min_samples
+
+        resolved = _resolve_model(model)
+        if use_processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(model,)
+            )
+            self._model = None
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            self._model = resolved
+        self._has_model = model is not None
+        self._dtype = getattr(resolved, "dtype", np.float64)
+        # checked per request, so one malformed request cannot fail its batch
+        components = getattr(resolved, "components_", None)
+        self._n_features = None if components is None else components.shape[1]
+        self._closed = False
+
+        self._queue = deque()
+        self._queued_rows = 0
+        self._slots = None
+        self._wakeup = None
+        self._batch_full = None
+        self._running_batches = None
+        self._batcher = None
+        self._batch_tasks = set()
+
+        self._latencies = deque(maxlen=10000)
+        self._batch_sizes = deque(maxlen=10000)
+        self._requests = 0
+        self._fits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """
+        Stops the batcher and shuts the worker pool down. Batches already
+        running complete; requests still waiting in the queue fail with
+        RuntimeError.
+        """
+        self._closed = True
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        while self._queue:
+            _, future, _ = self._queue.popleft()
+            if not future.done():
+                future.set_exception(RuntimeError("ClusteringService is closed"))
+        self._queued_rows = 0
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        # shutting the pool down blocks until running work is done,
+        # keep that off the loop
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def cluster_async(self, X, eps=None, min_samples=None):
+        """
+        Fits a new DBSCAN on X in the worker pool.
+
+        Args:
+            X (array-like): Input data.
+            eps (float): Defaults to the service's eps.
+            min_samples (int): Defaults to the service's min_samples.
+        Returns:
+            DBSCAN: The fitted model.
+        """
+        if self._closed:
+            raise RuntimeError("ClusteringService is closed")
+
+        self._start()
+        eps = self.eps if eps is None else eps
+        min_samples = self.min_samples if min_samples is None else min_samples
+
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            model = await loop.run_in_executor(self._executor, _fit,
+                                               eps, min_samples, X)
+        self._fits += 1
+        return model
+
+    async def predict_async(self, X):
+        """
+        Predicts labels for X; concurrent calls share one batched predict.
+
+        Args:
+            X (array-like): New points.
+        Returns:
+            np.array: Cluster label per point.
+        """
+        if not self._has_model:
+            raise ValueError("ClusteringService was created without a fitted model")
+
+        if self._closed:
+            raise RuntimeError("ClusteringService is closed")
+
+        X, _ = check_array(X, dtype=self._dtype)
+        if self._n_features is not None and X.shape[1] != self._n_features:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but the model was fitted with "
+                f"{self._n_features}"
+            )
+        self._start()
+
+        async with self._slots:
+            # the service may have been closed while this request waited
+            if self._closed:
+                raise RuntimeError("ClusteringService is closed")
+            future = asyncio.get_running_loop().create_future()
+            self._queue.append((X, future, time.perf_counter()))
+            self._queued_rows += len(X)
+            self._wakeup.set()
+            if self._queued_rows >= self.max_batch_size:
+                self._batch_full.set()
+            return await future
+
+    def metrics(self):
+        """
+        Returns:
+            dict: Request and batch counters plus latency percentiles (seconds)
+                  over the most recent requests.
+        """
+        latencies = np.array(self._latencies)
+        batch_sizes = np.array(self._batch_sizes)
+        metrics = {
+            "requests": self._requests,
+            "fits": self._fits,
+            "batches": len(batch_sizes),
+            "queued": len(self._queue),
+            "mean_batch_size": float(batch_sizes.mean()) if batch_sizes.size else 0.0,
+        }
+        for name, q in (("p50", 50), ("p95", 95), ("p99", 99)):
+            metrics[f"latency_{name}"] = (float(np.percentile(latencies, q))
+                                          if latencies.size else 0.0)
+        return metrics
+
+    def _start(self):
+        # asyncio primitives are created lazily, inside the running loop
+        if self._batcher is not None:
+            return
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._wakeup = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._running_batches = asyncio.Semaphore(self.max_workers)
+        self._batcher = asyncio.get_running_loop().create_task(self._batch_loop())
+
+    async def _batch_loop(self):
+        while True:
+            await self._wakeup.wait()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), self.max_delay)
+            except asyncio.TimeoutError:
+                pass
+
+            await self._running_batches.acquire()
+            batch = self._take_batch()
+            # the loop only keeps weak references to tasks
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+            if not self._queue:
+                self._wakeup.clear()
+            if self._queued_rows < self.max_batch_size:
+                self._batch_full.clear()
+
+    def _take_batch(self):
+        batch = []
+        rows = 0
+        while self._queue:
+            if batch and rows + len(self._queue[0][0]) > self.max_batch_size:
+                break
+            request = self._queue.popleft()
+            batch.append(request)
+            rows += len(request[0])
+        self._queued_rows -= rows
+        return batch
+
+    async def _run_batch(self, batch):
+        try:
+            X = np.concatenate([request[0] for request in batch])
+            loop = asyncio.get_running_loop()
+            predict = _worker_predict if self._model is None else self._model.predict
+            labels = await loop.run_in_executor(self._executor, predict, X)
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._running_batches.release()
+
+        done = time.perf_counter()
+        offsets = np.cumsum([len(request[0]) for request in batch])[:-1]
+        for (_, future, enqueued), part in zip(batch, np.split(labels, offsets)):
+            if not future.done():
+                future.set_result(part)
+            self._latencies.append(done - enqueued)
+        self._requests += len(batch)
+        self._batch_sizes.append(len(batch))
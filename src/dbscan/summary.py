@@ -0,0 +1,81 @@
+import numpy as np
+
+from .batch import BLOCK_ELEMENTS
+
+
+def cluster_summary(X, labels, core_mask):
+    """
+    Per-cluster statistics computed with bincount / segment reductions,
+    without converting the labels to Python objects.
+
+    Args:
+        X (np.array): Data points, shape (n_samples, n_features).
+        labels (np.array): Cluster label per point, -1 for noise.
+        core_mask (np.array): Boolean array marking core points.
+    Returns:
+        dict: ``n_clusters`` and ``n_noise`` (ints), plus arrays indexed by
+              cluster id: ``size``, ``n_core``, ``n_border`` (n_clusters,),
+              ``centroid``, ``bbox_min``, ``bbox_max`` (n_clusters, n_features)
+              and ``medoid_index`` (n_clusters,), the index into X of the
+              member with the smallest summed distance to the other members
+              (the lowest such index on ties).
+    """
+    X = np.asarray(X, dtype=np.float64)
+    labels = np.asarray(labels)
+    core_mask = np.asarray(core_mask, dtype=bool)
+    n_features = X.shape[1] if X.ndim == 2 else 0
+
+    member = labels >= 0
+    member_idx = np.flatnonzero(member)
+    lab = labels[member]
+    pts = X[member]
+    n_clusters = int(lab.max()) + 1 if lab.size else 0
+
+    size = np.bincount(lab, minlength=n_clusters)
+    n_core = np.bincount(lab[core_mask[member]], minlength=n_clusters)
+
+    centroid = np.empty((n_clusters, n_features))
+    for j in range(n_features):
+        centroid[:, j] = np.bincount(lab, weights=pts[:, j], minlength=n_clusters)
+    centroid /= np.maximum(size, 1)[:, None]
+
+    bbox_min = np.full((n_clusters, n_features), np.inf)
+    bbox_max = np.full((n_clusters, n_features), -np.inf)
+    np.minimum.at(bbox_min, lab, pts)
+    np.maximum.at(bbox_max, lab, pts)
+
+    # members grouped by cluster, in index order within each cluster
+    order = np.argsort(lab, kind="stable")
+    bounds = np.searchsorted(lab[order], np.arange(n_clusters + 1))
+    medoid_index = np.empty(n_clusters, dtype=np.intp)
+    for k in range(n_clusters):
+        idx = member_idx[order[bounds[k]:bounds[k + 1]]]
+        medoid_index[k] = idx[_medoid(X[idx])]
+
+    return {
+        "n_clusters": n_clusters,
+        "n_noise": int(labels.size - lab.size),
+        "size": size,
+        "n_core": n_core,
+        "n_border": size - n_core,
+        "centroid": centroid,
+        "bbox_min": bbox_min,
+        "bbox_max": bbox_max,
+        "medoid_index": medoid_index,
+    }
+
+
+def _medoid(P):
+    """Position in P of the medoid, from row blocks of the pairwise distances."""
+    step = max(1, BLOCK_ELEMENTS // (len(P) * max(P.shape[1], 1)))
+    total = np.empty(len(P))
+    for start in range(0, len(P), step):
+        rows = P[start:start + step]
+        # accumulate per feature, so a block never holds a 3D difference tensor
+        dist = np.zeros((len(rows), len(P)))
+        diff = np.empty_like(dist)
+        for j in range(P.shape[1]):
+            np.subtract(rows[:, j, None], P[None, :, j], out=diff)
+            dist += np.square(diff, out=diff)
+        total[start:start + step] = np.sqrt(dist, out=dist).sum(axis=1)
+    return int(np.argmin(total))
@@ -12,4 +12,19 @@ def euclidean_distance(point_a, point_b):
     Returns:
         float: The distance between points.
     """
-    return np.sqrt(np.sum((point_a - point_b) ** 2))
\ No newline at end of file
+    return np.sqrt(np.sum((point_a - point_b) ** 2))
+
+
+def euclidean_distances_to(X, point):
+    """
+    Calculates the Euclidean distance from every row of X to one point,
+    with the same arithmetic as :func:`euclidean_distance`.
+
+    Args:
+        X (np.array): Points, shape (n_samples, n_features).
+        point (np.array): Coordinates of the reference point.
+
+    Returns:
+        np.array: Distance per row of X.
+    """
+    return np.sqrt(np.sum((X - point) ** 2, axis=1))
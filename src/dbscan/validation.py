@@ -0,0 +1,47 @@
+import numpy as np
+
+
+def check_array(X, dtype=np.float64):
+    """
+    Converts input data to a C-contiguous 2D array of the given dtype,
+    copying at most once.
+
+    NumPy arrays, memmaps, memoryviews and other buffer-protocol objects
+    that already have the right layout and dtype are used as-is; otherwise
+    the layout and dtype are fixed in a single conversion. pandas
+    DataFrames (detected by duck typing, pandas is never imported here)
+    keep their columns in separate blocks, so they always need one copy,
+    which is filled column by column. An empty sequence is read as zero
+    samples.
+
+    Args:
+        X (array-like): Input data, shape (n_samples, n_features).
+        dtype (np.dtype): dtype of the returned array.
+    Returns:
+        tuple: (np.array, bool) The validated array and whether it was copied.
+    """
+    if hasattr(X, "to_numpy") and hasattr(X, "columns"):
+        if len(X.shape) != 2:
+            raise ValueError(
+                f"Expected a 2D array, got an array with shape {X.shape}"
+            )
+        result = np.empty(X.shape, dtype=dtype)
+        for j in range(X.shape[1]):
+            result[:, j] = X.iloc[:, j].to_numpy()
+        return result, True
+
+    if hasattr(X, "to_numpy"):
+        X = X.to_numpy()
+
+    result = np.asarray(X, dtype=dtype, order="C")
+    # np.asarray only allocates when it could not reuse the source buffer
+    copied = result is not X and result.flags.owndata
+
+    if result.ndim == 1 and result.size == 0:
+        result = result.reshape(0, 0)
+    if result.ndim != 2:
+        raise ValueError(
+            f"Expected a 2D array, got an array with shape {result.shape}"
+        )
+
+    return result, copied
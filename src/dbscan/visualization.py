@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 
 
@@ -12,6 +11,9 @@ def plot_clusters(X, labels, title="DBSCAN Clustering"):
         labels (list/array): Cluster labels for each point.
         title (str): Title of the plot.
     """
+    # imported here so that `import dbscan` does not pay for matplotlib
+    # (install with the `plot` extra)
+    import matplotlib.pyplot as plt
 
     unique_labels = set(labels)
 
@@ -1,6 +1,21 @@
 import pytest
 import numpy as np
 from dbscan.dbscan import DBSCAN
+from dbscan.profiling import FitProfiler, format_report
+
+
+@pytest.fixture
+def fit_profiler(request):
+    """
+    FitProfiler for tests marked ``memprofile``; its reports are printed
+    after the test (run with ``pytest -m memprofile -s`` to see them).
+    """
+    profiler = FitProfiler()
+    yield profiler
+    if request.node.get_closest_marker("memprofile") is not None:
+        for report in profiler.reports:
+            print()
+            print(format_report(report))
 
 
 class TestDBSCAN:
@@ -0,0 +1,126 @@
+"""
+Compares where DBSCAN.fit allocates between two git revisions or two sets
+of DBSCAN options. Every side runs in a fresh interpreter that only imports
+NumPy and dbscan, so the peak RSS growth of the fit is comparable.
+
+    python tests/run_memory_profile.py --revs HEAD~1 HEAD
+    python tests/run_memory_profile.py --options dtype=float64 dtype=float32
+"""
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILING_PATH = os.path.join(REPO_DIR, "src", "dbscan", "profiling.py")
+
+
+def load_profiling():
+    """
+    Uses the profiling module of the revision under test if it has one,
+    otherwise loads the current one standalone (it only needs the stdlib).
+    Older revisions then report no phases, but totals and queries still work.
+    """
+    try:
+        from dbscan import profiling
+    except ImportError:
+        spec = importlib.util.spec_from_file_location("dbscan_profiling",
+                                                      PROFILING_PATH)
+        profiling = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(profiling)
+    return profiling
+
+
+def make_moons(n_samples, noise, seed):
+    """Two interleaving half circles, like sklearn's make_moons."""
+    n_outer = n_samples // 2
+    outer = np.linspace(0, np.pi, n_outer)
+    inner = np.linspace(0, np.pi, n_samples - n_outer)
+    X = np.vstack([
+        np.column_stack([np.cos(outer), np.sin(outer)]),
+        np.column_stack([1 - np.cos(inner), 0.5 - np.sin(inner)]),
+    ])
+    return X + np.random.default_rng(seed).normal(scale=noise, size=X.shape)
+
+
+def child(args):
+    # no sklearn here, its import would dominate the process's peak RSS
+    from dbscan.dbscan import DBSCAN
+
+    profiling = load_profiling()
+    options = dict(option.split("=", 1) for option in args.option)
+
+    X = make_moons(args.n_samples, noise=0.1, seed=42)
+    model = DBSCAN(eps=args.eps, min_samples=args.min_samples, **options)
+    report = profiling.FitProfiler().profile_fit(model, X, label=args.label)
+    print(json.dumps(report))
+
+
+def run_side(label, src_dir, options, args):
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child", "--label", label,
+        "--n-samples", str(args.n_samples), "--eps", str(args.eps),
+        "--min-samples", str(args.min_samples),
+    ]
+    for option in options:
+        command += ["--option", option]
+
+    env = dict(os.environ, PYTHONPATH=src_dir)
+    output = subprocess.run(command, env=env, check=True, capture_output=True,
+                            text=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def profile_revision(rev, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = os.path.join(tmp, "worktree")
+        subprocess.run(["git", "worktree", "add", "--detach", worktree, rev],
+                       cwd=REPO_DIR, check=True, capture_output=True)
+        try:
+            return run_side(rev, os.path.join(worktree, "src"), [], args)
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", worktree],
+                           cwd=REPO_DIR, check=True, capture_output=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--revs", nargs=2, metavar=("BASE", "CANDIDATE"))
+    parser.add_argument("--options", nargs=2, metavar=("BASE", "CANDIDATE"),
+                        help="comma separated key=value DBSCAN options per side")
+    parser.add_argument("--n-samples", type=int, default=300)
+    parser.add_argument("--eps", type=float, default=0.25)
+    parser.add_argument("--min-samples", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--label", help=argparse.SUPPRESS)
+    parser.add_argument("--option", action="append", default=[], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    if args.revs:
+        reports = [profile_revision(rev, args) for rev in args.revs]
+    else:
+        sides = args.options or ["", ""]
+        src_dir = os.path.join(REPO_DIR, "src")
+        reports = [run_side(side or "default", src_dir,
+                            [option for option in side.split(",") if option], args)
+                   for side in sides]
+
+    profiling = load_profiling()
+    for report in reports:
+        print(profiling.format_report(report))
+        print()
+    print(profiling.compare_reports(*reports))
+
+
+if __name__ == "__main__":
+    main()
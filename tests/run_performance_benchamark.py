@@ -5,12 +5,15 @@ from sklearn.cluster import DBSCAN as SklearnDBSCAN
 
 # Import your custom implementation
 from dbscan.dbscan import DBSCAN as MyDBSCAN
+from dbscan.profiling import FitProfiler, format_report
 
 
-def run_performance_benchmark(n_samples=300, eps=0.25, min_samples=5):
+def run_performance_benchmark(n_samples=300, eps=0.25, min_samples=5, profile=False):
     """
     Runs a detailed performance benchmark comparing custom DBSCAN vs Scikit-Learn.
     Prints results to console for direct reporting.
+    With profile=True the custom fit is run once more under tracemalloc and its
+    memory report is printed as well.
     """
 
     # --- CONFIGURATION ---
@@ -56,7 +59,15 @@ def run_performance_benchmark(n_samples=300, eps=0.25, min_samples=5):
     else:
         print("\nConclusion: Performance difference is acceptable, but custom code is still slower.")
 
+    if profile:
+        # separate run, tracemalloc slows the fit down considerably
+        model = MyDBSCAN(eps=eps, min_samples=min_samples)
+        report = FitProfiler().profile_fit(model, X)
+        print()
+        print(format_report(report))
+
 
 if __name__ == "__main__":
     # You can change N_SAMPLES here to N=500 or N=1000 to see the huge difference
+    # Pass profile=True to also print where the custom fit allocates memory
     run_performance_benchmark(n_samples=300)
\ No newline at end of file
@@ -0,0 +1,76 @@
+import tracemalloc
+
+import numpy as np
+from sklearn.datasets import make_blobs, make_moons
+
+from dbscan.dbscan import DBSCAN
+from dbscan.batch import fit_many, _plan_chunks
+
+
+def _random_groups(n_groups, seed):
+    rng = np.random.default_rng(seed)
+    groups = []
+    for k in range(n_groups):
+        n = int(rng.integers(5, 120))
+        if k % 2:
+            x, _ = make_moons(n_samples=n, noise=0.1, random_state=k)
+        else:
+            x, _ = make_blobs(n_samples=n, centers=3, cluster_std=0.3, random_state=k)
+        groups.append(x)
+    return groups
+
+
+def test_fit_many_matches_fit():
+    groups = _random_groups(30, seed=0)
+    model = DBSCAN(eps=0.3, min_samples=4)
+
+    batched = model.fit_many(groups)
+
+    assert len(batched) == len(groups)
+    for x, labels in zip(groups, batched):
+        expected = DBSCAN(eps=0.3, min_samples=4).fit(x)
+        np.testing.assert_array_equal(labels, expected.labels_)
+
+
+def test_fit_many_core_masks_and_processes(monkeypatch):
+    # small blocks so the groups are really split across workers
+    monkeypatch.setattr("dbscan.batch.BLOCK_ELEMENTS", 50_000)
+    groups = _random_groups(12, seed=1) + [np.empty((0, 2))]
+
+    labels, core = fit_many(groups, 0.3, 4, return_core=True)
+    assert len(_plan_chunks(groups)) > 1
+    sharded = fit_many(groups, 0.3, 4, n_jobs=2)
+
+    for x, group_labels, group_core, other in zip(groups, labels, core, sharded):
+        expected = DBSCAN(eps=0.3, min_samples=4).fit(x)
+        np.testing.assert_array_equal(np.flatnonzero(group_core),
+                                      expected.core_sample_indices_)
+        np.testing.assert_array_equal(other, group_labels)
+
+
+def test_fit_many_large_group_stays_within_block(monkeypatch):
+    monkeypatch.setattr("dbscan.batch.BLOCK_ELEMENTS", 4_000)
+    groups = _random_groups(6, seed=2)
+    assert any(len(x) ** 2 * x.shape[1] > 4_000 for x in groups)
+
+    tracemalloc.start()
+    batched = fit_many(groups, 0.3, 4)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # a full pairwise tensor of the largest group would be several times this
+    assert peak < 4_000 * 8 * 4
+    for x, labels in zip(groups, batched):
+        expected = DBSCAN(eps=0.3, min_samples=4).fit(x).labels_
+        np.testing.assert_array_equal(labels, expected)
+
+
+def test_fit_many_ignores_padding_when_every_point_is_core():
+    rng = np.random.default_rng(0)
+    groups = [rng.random((3, 2)), rng.random((5, 2))]
+
+    batched = fit_many(groups, 0.1, 0)
+
+    for x, labels in zip(groups, batched):
+        expected = DBSCAN(eps=0.1, min_samples=0).fit(x)
+        np.testing.assert_array_equal(labels, expected.labels_)
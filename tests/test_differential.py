@@ -0,0 +1,164 @@
+"""
+Differential tests: every clustering engine in the package must agree with
+the brute-force DBSCAN on the same input.
+
+Inputs come from seeded generators that cover the awkward cases (exact
+duplicates, pairs at exactly eps, high dimensions, one giant cluster,
+mostly noise). The size tier is chosen with DBSCAN_DIFF_TIER
+(small, medium, large, huge) and extra seeds with DBSCAN_DIFF_SEEDS,
+e.g.::
+
+    DBSCAN_DIFF_TIER=medium DBSCAN_DIFF_SEEDS=0,1,2 pytest tests/test_differential.py
+
+Engines declare the sizes they can handle; in each case the first capable
+engine is the reference for the others.
+
+Fit times are appended to the benchmark history file (DBSCAN_BENCHMARK_HISTORY,
+default ``benchmark_history.jsonl`` in the repository root).
+"""
+import json
+import os
+import subprocess
+import time
+
+import numpy as np
+import pytest
+
+from dbscan.batch import fit_many
+from dbscan.dbscan import DBSCAN
+from dbscan.optics import OPTICS
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIERS = {"small": 300, "medium": 3_000, "large": 30_000, "huge": 1_000_000}
+TIER = os.environ.get("DBSCAN_DIFF_TIER", "small")
+SEEDS = [int(seed) for seed in os.environ.get("DBSCAN_DIFF_SEEDS", "0").split(",")]
+HISTORY_PATH = os.environ.get("DBSCAN_BENCHMARK_HISTORY",
+                              os.path.join(REPO_DIR, "benchmark_history.jsonl"))
+
+
+# --- generators: (n, rng) -> (X, eps, min_samples) ---
+
+def gen_blobs(n, rng):
+    centers = rng.uniform(-10, 10, size=(5, 2))
+    X = centers[rng.integers(0, 5, n)] + rng.normal(scale=0.5, size=(n, 2))
+    X[: n // 20] = rng.uniform(-12, 12, size=(n // 20, 2))
+    return X, 0.4, 5
+
+
+def gen_duplicates(n, rng):
+    base = rng.uniform(-5, 5, size=(max(n // 8, 1), 2))
+    return base[rng.integers(0, len(base), n)], 0.05, 6
+
+
+def gen_exact_eps(n, rng):
+    # integer lattice: many pairs are exactly eps=1.0 apart
+    side = int(np.sqrt(n) * 1.4) + 1
+    return rng.integers(0, side, size=(n, 2)).astype(np.float64), 1.0, 4
+
+
+def gen_high_dim(n, rng):
+    centers = rng.normal(scale=4.0, size=(3, 32))
+    X = centers[rng.integers(0, 3, n)] + rng.normal(size=(n, 32))
+    return X, 6.5, 5
+
+
+def gen_giant_cluster(n, rng):
+    return rng.normal(scale=1.0, size=(n, 2)), 0.5, 4
+
+
+def gen_mostly_noise(n, rng):
+    return rng.uniform(0, 100, size=(n, 3)), 100 * (0.6 / n) ** (1 / 3), 3
+
+
+GENERATORS = [gen_blobs, gen_duplicates, gen_exact_eps, gen_high_dim,
+              gen_giant_cluster, gen_mostly_noise]
+
+
+# --- engines: (X, eps, min_samples) -> (labels, core mask) ---
+
+def run_dbscan(X, eps, min_samples):
+    model = DBSCAN(eps=eps, min_samples=min_samples).fit(X)
+    core = np.zeros(len(X), dtype=bool)
+    core[model.core_sample_indices_] = True
+    return model.labels_, core
+
+
+def run_fit_many(X, eps, min_samples):
+    labels, core = fit_many([X], eps, min_samples, return_core=True)
+    return labels[0], core[0]
+
+
+def run_optics(X, eps, min_samples):
+    optics = OPTICS(min_samples=min_samples, max_eps=eps).fit(X)
+    return optics.extract_dbscan(eps), optics.core_distances_ <= eps
+
+
+# name, function, largest (n, n_features) it can handle, exact labels or core-exact only
+ENGINES = [
+    ("dbscan", run_dbscan, lambda n, d: n <= 3_000, True),
+    ("fit_many", run_fit_many, lambda n, d: n <= 30_000, True),
+    ("optics", run_optics, lambda n, d: n <= 30_000, False),
+]
+
+
+def assert_equivalent(X, eps, reference, candidate, exact):
+    ref_labels, ref_core = reference
+    labels, core = candidate
+
+    np.testing.assert_array_equal(core, ref_core, err_msg="core masks differ")
+    if exact:
+        np.testing.assert_array_equal(labels, ref_labels, err_msg="labels differ")
+        return
+
+    # same clusters of core points, same noise; borders may pick any adjacent cluster
+    pairs = set(zip(labels[ref_core].tolist(), ref_labels[ref_core].tolist()))
+    assert len(pairs) == len(set(labels[ref_core].tolist())) \
+        == len(set(ref_labels[ref_core].tolist())), "core partitions differ"
+    np.testing.assert_array_equal(labels == -1, ref_labels == -1,
+                                  err_msg="noise differs")
+
+    core_idx = np.flatnonzero(core)
+    for i in np.flatnonzero((labels != -1) & ~core):
+        members = core_idx[labels[core_idx] == labels[i]]
+        dist = np.sqrt(np.sum((X[members] - X[i]) ** 2, axis=1))
+        assert dist.min() <= eps, f"border point {i} is not within eps of its cluster"
+
+
+@pytest.fixture(scope="module")
+def timings():
+    records = []
+    yield records
+    if not records:
+        return
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                                  capture_output=True, text=True).stdout.strip()
+    except OSError:
+        revision = None
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        for record in records:
+            record = dict(record, revision=revision, timestamp=time.time())
+            f.write(json.dumps(record) + "\n")
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("generator", GENERATORS, ids=lambda g: g.__name__[4:])
+def test_engines_agree(generator, seed, timings):
+    n = TIERS[TIER]
+    X, eps, min_samples = generator(n, np.random.default_rng(seed))
+    engines = [engine for engine in ENGINES if engine[2](len(X), X.shape[1])]
+    if len(engines) < 2:
+        pytest.skip(f"fewer than two engines handle n={n}, d={X.shape[1]}")
+
+    results = []
+    for name, run, _, exact in engines:
+        start = time.perf_counter()
+        results.append(run(X, eps, min_samples))
+        timings.append({"engine": name, "case": generator.__name__[4:], "seed": seed,
+                        "n": len(X), "d": X.shape[1],
+                        "seconds": time.perf_counter() - start})
+
+    reference = results[0]
+    for (name, _, _, exact), result in zip(engines[1:], results[1:]):
+        assert_equivalent(X, eps, reference, result, exact=exact and engines[0][3])
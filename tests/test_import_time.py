@@ -0,0 +1,61 @@
+"""
+Guards the start-up cost of `import dbscan` for short-lived workers that only
+need DBSCAN.fit: no optional dependency may be imported eagerly, and the
+package's own import time on top of NumPy must stay small.
+"""
+import subprocess
+import sys
+
+# modules that only plotting, reporting, comparison, the service, save/load
+# or the profiler may pull in
+OPTIONAL_MODULES = ["matplotlib", "sklearn", "pandas", "scipy", "asyncio",
+                    "concurrent", "importlib.metadata", "dbscan.persistence",
+                    "dbscan.profiling", "json", "shutil", "tempfile", "random",
+                    "bz2", "lzma", "tracemalloc"]
+
+# budget for dbscan's own import time, NumPy excluded (microseconds); about
+# 6 ms were measured, so a newly eager dependency of a few ms trips it
+IMPORT_BUDGET_US = 10_000
+
+
+def _run(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code],
+                          capture_output=True, text=True, check=True)
+
+
+def _top_level_import_times(stderr):
+    """Parses `python -X importtime` output into {module: cumulative us}."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented below the module that triggered them
+        if not name[1:].startswith(" "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_loads_only_numpy_and_core():
+    # json is one of the modules checked, so the child does not use it
+    output = _run("import sys, dbscan; dbscan.DBSCAN; print(*sys.modules)")
+    modules = output.stdout.split()
+
+    loaded = [name for name in OPTIONAL_MODULES
+              if any(m == name or m.startswith(name + ".") for m in modules)]
+    assert loaded == [], f"`import dbscan` eagerly imports {loaded}"
+
+
+def test_lazy_attributes_resolve():
+    output = _run("import sys, dbscan; dbscan.OPTICS; dbscan.plot_clusters; "
+                  "print(dbscan.__version__ != ''); print('matplotlib' in sys.modules)")
+    assert output.stdout.split() == ["True", "False"]
+
+
+def test_import_time_budget():
+    # numpy is imported first, so the dbscan entry no longer includes it
+    output = _run("import numpy, dbscan", "-X", "importtime")
+    times = _top_level_import_times(output.stderr)
+
+    own = times["dbscan"]
+    assert own < IMPORT_BUDGET_US, f"dbscan adds {own / 1000:.1f} ms on top of NumPy"
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from sklearn.cluster import OPTICS as SklearnOPTICS
+from sklearn.datasets import make_blobs
+
+from dbscan.dbscan import DBSCAN
+from dbscan.optics import OPTICS
+
+
+def _multi_density_data():
+    dense, _ = make_blobs(n_samples=150, centers=[[0, 0]], cluster_std=0.2,
+                          random_state=1)
+    sparse, _ = make_blobs(n_samples=150, centers=[[6, 6], [6, -6]], cluster_std=1.0,
+                           random_state=2)
+    noise = np.random.default_rng(3).uniform(-10, 10, size=(20, 2))
+    return np.vstack([dense, sparse, noise])
+
+
+def _same_partition(a, b):
+    pairs = set(zip(a.tolist(), b.tolist()))
+    return len(pairs) == len(set(a.tolist())) == len(set(b.tolist()))
+
+
+def test_core_distances_match_sklearn():
+    x = _multi_density_data()
+
+    mine = OPTICS(min_samples=5).fit(x)
+    reference = SklearnOPTICS(min_samples=5).fit(x)
+
+    np.testing.assert_allclose(mine.core_distances_, reference.core_distances_)
+    assert sorted(mine.ordering_.tolist()) == list(range(len(x)))
+
+
+@pytest.mark.parametrize("eps", [0.15, 0.3, 0.8, 1.5])
+def test_extract_dbscan_matches_dbscan(eps):
+    x = _multi_density_data()
+    optics = OPTICS(min_samples=5, max_eps=2.0).fit(x)
+
+    labels = optics.extract_dbscan(eps)
+    expected = DBSCAN(eps=eps, min_samples=5).fit(x)
+
+    core = expected.core_sample_indices_
+    np.testing.assert_array_equal(np.flatnonzero(optics.core_distances_ <= eps), core)
+    assert _same_partition(labels[core], expected.labels_[core])
+    np.testing.assert_array_equal(labels == -1, expected.labels_ == -1)
+
+    # every border point sits in a cluster that has a core point within eps of it
+    for i in np.flatnonzero((labels != -1) & (optics.core_distances_ > eps)):
+        members = core[labels[core] == labels[i]]
+        assert np.min(np.linalg.norm(x[members] - x[i], axis=1)) <= eps
+
+
+def test_save_load_reachability_plot(tmp_path):
+    x = _multi_density_data()
+    optics = OPTICS(min_samples=5, max_eps=2.0).fit(x)
+    optics.save(tmp_path / "optics")
+
+    loaded = OPTICS.load(tmp_path / "optics")
+
+    assert isinstance(loaded.reachability_, np.memmap)
+    np.testing.assert_array_equal(loaded.extract_dbscan(0.5),
+                                  optics.extract_dbscan(0.5))
+    with pytest.raises(ValueError):
+        loaded.extract_dbscan(3.0)
+
+
+def test_save_accepts_numpy_min_samples(tmp_path):
+    x = _multi_density_data()
+    optics = OPTICS(min_samples=np.int64(5), max_eps=2.0).fit(x)
+    optics.save(tmp_path / "optics")
+
+    assert OPTICS.load(tmp_path / "optics").min_samples == 5
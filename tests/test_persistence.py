@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from sklearn.datasets import make_moons
+from sklearn.cluster import DBSCAN as SklearnDBSCAN
+
+from dbscan.dbscan import DBSCAN
+
+
+def test_core_samples_match_sklearn():
+    x, _ = make_moons(n_samples=200, noise=0.05, random_state=42)
+
+    my_model = DBSCAN(eps=0.2, min_samples=5).fit(x)
+    sklearn_model = SklearnDBSCAN(eps=0.2, min_samples=5).fit(x)
+
+    np.testing.assert_array_equal(my_model.core_sample_indices_,
+                                  sklearn_model.core_sample_indices_)
+    np.testing.assert_array_equal(my_model.components_, sklearn_model.components_)
+
+
+def test_save_load_roundtrip(tmp_path):
+    x, _ = make_moons(n_samples=150, noise=0.05, random_state=0)
+    model = DBSCAN(eps=0.2, min_samples=5).fit(x)
+    model.save(tmp_path / "model")
+
+    loaded = DBSCAN.load(tmp_path / "model")
+
+    assert loaded.eps == model.eps
+    assert loaded.min_samples == model.min_samples
+    assert isinstance(loaded.labels_, np.memmap)
+    np.testing.assert_array_equal(loaded.labels_, model.labels_)
+    np.testing.assert_array_equal(loaded.core_sample_indices_,
+                                  model.core_sample_indices_)
+    np.testing.assert_array_equal(loaded.components_, model.components_)
+    assert loaded.cluster_summary_.keys() == model.cluster_summary_.keys()
+    for key, value in model.cluster_summary_.items():
+        np.testing.assert_array_equal(loaded.cluster_summary_[key], value)
+    assert isinstance(loaded.cluster_summary_["centroid"], np.memmap)
+
+    in_memory = DBSCAN.load(tmp_path / "model", mmap=False)
+    assert not isinstance(in_memory.labels_, np.memmap)
+
+
+def test_save_accepts_numpy_scalar_params(tmp_path):
+    x, _ = make_moons(n_samples=100, noise=0.05, random_state=0)
+    model = DBSCAN(eps=np.float32(0.2), min_samples=np.int64(5)).fit(x)
+    model.save(tmp_path / "model")
+
+    loaded = DBSCAN.load(tmp_path / "model")
+    assert loaded.min_samples == 5
+    np.testing.assert_array_equal(loaded.labels_, model.labels_)
+
+
+def test_save_unfitted_raises(tmp_path):
+    with pytest.raises(ValueError):
+        DBSCAN(eps=0.5, min_samples=5).save(tmp_path / "model")
+
+
+def test_save_replaces_mapped_model_atomically(tmp_path):
+    x, _ = make_moons(n_samples=100, noise=0.05, random_state=0)
+    DBSCAN(eps=0.2, min_samples=5).fit(x).save(tmp_path / "model")
+    reader = DBSCAN.load(tmp_path / "model")
+    old_labels = np.array(reader.labels_)
+
+    DBSCAN(eps=0.05, min_samples=5).fit(x).save(tmp_path / "model")
+
+    # the old mapping still sees the old, complete arrays
+    np.testing.assert_array_equal(reader.labels_, old_labels)
+    assert DBSCAN.load(tmp_path / "model").eps == 0.05
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["model"]
+
+
+def test_save_keeps_one_previous_version(tmp_path):
+    x, _ = make_moons(n_samples=100, noise=0.05, random_state=0)
+    model = DBSCAN(eps=0.2, min_samples=5).fit(x)
+    for _ in range(3):
+        model.save(tmp_path / "model")
+
+    # a reader that resolved the old version before the last save can still
+    # open its files; anything older is gone
+    versions = [p for p in (tmp_path / "model").iterdir() if p.name.startswith("v-")]
+    assert len(versions) == 2
+    assert (tmp_path / "model" / "current").resolve() in versions
+
+
+def test_save_refuses_to_replace_other_directories(tmp_path):
+    x, _ = make_moons(n_samples=100, noise=0.05, random_state=0)
+    model = DBSCAN(eps=0.2, min_samples=5).fit(x)
+    (tmp_path / "important.txt").write_text("keep me")
+
+    with pytest.raises(ValueError):
+        model.save(tmp_path)
+    with pytest.raises(ValueError):
+        model.save(tmp_path / "important.txt")
+    assert (tmp_path / "important.txt").read_text() == "keep me"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["important.txt"]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from sklearn.datasets import make_moons
+
+from dbscan.dbscan import DBSCAN
+from dbscan.profiling import compare_reports, format_report
+
+
+@pytest.mark.memprofile
+def test_profile_fit_records_phases_and_queries(fit_profiler):
+    x, _ = make_moons(n_samples=150, noise=0.05, random_state=42)
+    model = DBSCAN(eps=0.2, min_samples=5)
+
+    report = fit_profiler.profile_fit(model, x)
+
+    assert [p["name"] for p in report["phases"]] == ["validate", "cluster", "summarize"]
+    assert report["queries"]["count"] == len(x)
+    assert report["peak"] >= max(p["peak"] for p in report["phases"]) > 0
+    assert report["peak_rss_growth_kb"] >= 0
+    # the instrumentation is removed again and the fit itself is unaffected
+    assert "_get_neighbors" not in vars(model)
+    expected = DBSCAN(eps=0.2, min_samples=5).fit(x).labels_
+    np.testing.assert_array_equal(model.labels_, expected)
+    assert "neighbor queries: 150" in format_report(report)
+
+
+@pytest.mark.memprofile
+def test_compare_reports(fit_profiler):
+    x, _ = make_moons(n_samples=100, noise=0.05, random_state=42)
+
+    a = fit_profiler.profile_fit(DBSCAN(eps=0.2, min_samples=5), x, label="float64")
+    b = fit_profiler.profile_fit(DBSCAN(eps=0.2, min_samples=5, dtype=np.float32), x,
+                                 label="float32")
+
+    table = compare_reports(a, b)
+    assert "| Metric | float64 | float32 | Ratio |" in table
+    assert "cluster peak (KiB)" in table
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_moons
+
+from dbscan.dbscan import DBSCAN
+from dbscan.service import ClusteringService
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    x, _ = make_moons(n_samples=200, noise=0.05, random_state=42)
+    return x, DBSCAN(eps=0.2, min_samples=5).fit(x)
+
+
+class _BlockingModel:
+    """Delegates to a fitted model once `release` is set."""
+
+    def __init__(self, model):
+        self.model = model
+        self.dtype = model.dtype
+        self.components_ = model.components_
+        self.release = threading.Event()
+
+    def predict(self, X):
+        self.release.wait()
+        return self.model.predict(X)
+
+
+async def _client(service, requests):
+    """In-process stand-in for a web handler firing concurrent requests."""
+    return await asyncio.gather(*(service.predict_async(points) for points in requests))
+
+
+def test_predict_matches_training_labels_of_core_points(fitted):
+    x, model = fitted
+    core = model.core_sample_indices_
+
+    np.testing.assert_array_equal(model.predict(x[core]), model.labels_[core])
+    assert model.predict([[10.0, 10.0]])[0] == -1
+
+
+def test_concurrent_predictions_are_batched(fitted):
+    x, model = fitted
+    requests = [x[i:i + 5] for i in range(0, len(x), 5)]
+
+    async def scenario():
+        async with ClusteringService(model, max_workers=2, max_delay=0.01) as service:
+            results = await _client(service, requests)
+            return results, service.metrics()
+
+    results, metrics = asyncio.run(scenario())
+
+    for points, labels in zip(requests, results):
+        np.testing.assert_array_equal(labels, model.predict(points))
+    assert metrics["requests"] == len(requests)
+    assert metrics["batches"] < len(requests)
+    assert metrics["latency_p95"] > 0
+
+
+def test_back_pressure_limits_pending_requests(fitted):
+    x, model = fitted
+    blocking = _BlockingModel(model)
+
+    async def scenario():
+        async with ClusteringService(blocking, max_workers=1, max_pending=3,
+                                     max_batch_size=1) as service:
+            requests = [asyncio.ensure_future(service.predict_async(x[i:i + 1]))
+                        for i in range(20)]
+            await asyncio.sleep(0.05)
+            # one request is stuck in the worker, two more fill the queue and
+            # the remaining callers wait for a slot
+            admitted = len(service._queue)
+            waiting = sum(not request.done() for request in requests)
+            blocking.release.set()
+            await asyncio.gather(*requests)
+            return admitted, waiting, service.metrics()
+
+    admitted, waiting, metrics = asyncio.run(scenario())
+    assert admitted == 2
+    assert waiting == 20
+    assert metrics["requests"] == 20
+    assert metrics["batches"] == 20
+
+
+def test_close_fails_queued_requests(fitted):
+    x, model = fitted
+    blocking = _BlockingModel(model)
+
+    async def scenario():
+        service = ClusteringService(blocking, max_workers=1, max_batch_size=1)
+        requests = [asyncio.ensure_future(service.predict_async(x[i:i + 1]))
+                    for i in range(3)]
+        await asyncio.sleep(0.05)
+        closing = asyncio.ensure_future(service.close())
+        await asyncio.sleep(0.05)
+        # the queued requests are failed without waiting for the running batch
+        queued_done = [request.done() for request in requests[1:]]
+        blocking.release.set()
+        await closing
+        return queued_done, await asyncio.gather(*requests, return_exceptions=True)
+
+    queued_done, results = asyncio.run(scenario())
+    assert queued_done == [True, True]
+    np.testing.assert_array_equal(results[0], model.predict(x[:1]))
+    assert all(isinstance(result, RuntimeError) for result in results[1:])
+
+
+def test_requests_after_close_are_rejected(fitted):
+    x, model = fitted
+
+    async def scenario():
+        service = ClusteringService(model)
+        await service.close()
+        for request in (service.cluster_async(x), service.predict_async(x[:5])):
+            with pytest.raises(RuntimeError, match="closed"):
+                await request
+        # no batcher was started again behind the closed service
+        return service._batcher
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_predict_rejects_wrong_feature_count(fitted):
+    x, model = fitted
+
+    with pytest.raises(ValueError):
+        model.predict(np.zeros((2, 3)))
+
+    async def scenario():
+        async with ClusteringService(model, max_delay=0.01) as service:
+            bad = service.predict_async(np.zeros((2, 3)))
+            good = service.predict_async(x[:5])
+            return await asyncio.gather(bad, good, return_exceptions=True)
+
+    bad, good = asyncio.run(scenario())
+    # the malformed request is rejected before it can fail the shared batch
+    assert isinstance(bad, ValueError)
+    np.testing.assert_array_equal(good, model.predict(x[:5]))
+
+
+def test_cluster_async_and_saved_model_in_processes(fitted, tmp_path):
+    x, model = fitted
+    model.save(tmp_path / "model")
+
+    async def scenario():
+        async with ClusteringService(tmp_path / "model", max_workers=2,
+                                     use_processes=True) as service:
+            fitted_model = await service.cluster_async(x, eps=0.2, min_samples=5)
+            labels = await service.predict_async(x[:10])
+            return fitted_model, labels
+
+    fitted_model, labels = asyncio.run(scenario())
+    np.testing.assert_array_equal(fitted_model.labels_, model.labels_)
+    np.testing.assert_array_equal(labels, model.predict(x[:10]))
+
+
+def test_predict_async_requires_model():
+    async def scenario():
+        async with ClusteringService() as service:
+            await service.predict_async([[0.0, 0.0]])
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
@@ -0,0 +1,55 @@
+import numpy as np
+from sklearn.datasets import make_blobs, make_moons
+
+from dbscan.dbscan import DBSCAN
+
+
+def test_cluster_summary_matches_labels():
+    x, _ = make_blobs(n_samples=300, centers=4, cluster_std=0.5, random_state=7)
+    x = np.vstack([x, [[50.0, 50.0], [-50.0, -50.0]]])
+    model = DBSCAN(eps=0.6, min_samples=5).fit(x)
+    summary = model.cluster_summary_
+    labels = model.labels_
+    core = np.zeros(len(x), dtype=bool)
+    core[model.core_sample_indices_] = True
+
+    assert summary["n_clusters"] == len(set(labels) - {-1})
+    assert summary["n_noise"] == list(labels).count(-1)
+
+    for k in range(summary["n_clusters"]):
+        members = x[labels == k]
+        assert summary["size"][k] == len(members)
+        assert summary["n_core"][k] == np.sum(core & (labels == k))
+        assert summary["n_border"][k] == summary["size"][k] - summary["n_core"][k]
+        np.testing.assert_allclose(summary["centroid"][k], members.mean(axis=0))
+        np.testing.assert_array_equal(summary["bbox_min"][k], members.min(axis=0))
+        np.testing.assert_array_equal(summary["bbox_max"][k], members.max(axis=0))
+
+        medoid = summary["medoid_index"][k]
+        assert labels[medoid] == k
+        total = np.sqrt(((members[:, None] - members[None]) ** 2).sum(-1)).sum(1)
+        assert np.isclose(total.min(), total[np.flatnonzero(labels == k) == medoid][0])
+
+
+def test_medoid_of_non_convex_cluster_is_a_real_medoid(monkeypatch):
+    # small blocks, so the pairwise distances are really split into rows
+    monkeypatch.setattr("dbscan.summary.BLOCK_ELEMENTS", 64)
+    x, _ = make_moons(n_samples=200, noise=0.05, random_state=0)
+    model = DBSCAN(eps=0.2, min_samples=5).fit(x)
+    summary = model.cluster_summary_
+
+    for k in range(summary["n_clusters"]):
+        idx = np.flatnonzero(model.labels_ == k)
+        members = x[idx]
+        total = np.sqrt(((members[:, None] - members[None]) ** 2).sum(-1)).sum(1)
+        assert summary["medoid_index"][k] == idx[np.argmin(total)]
+
+
+def test_cluster_summary_all_noise():
+    x = np.array([[0.0, 0.0], [10.0, 10.0], [20.0, 20.0]])
+    summary = DBSCAN(eps=1.0, min_samples=2).fit(x).cluster_summary_
+
+    assert summary["n_clusters"] == 0
+    assert summary["n_noise"] == 3
+    assert summary["size"].shape == (0,)
+    assert summary["centroid"].shape == (0, 2)
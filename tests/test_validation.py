@@ -0,0 +1,90 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_moons
+
+from dbscan.dbscan import DBSCAN
+from dbscan.validation import check_array
+
+
+def test_check_array_reuses_suitable_buffers(tmp_path):
+    x = np.random.default_rng(0).normal(size=(20, 3))
+
+    result, copied = check_array(x)
+    assert result is x
+    assert not copied
+
+    result, copied = check_array(memoryview(x))
+    assert np.shares_memory(result, x)
+    assert not copied
+
+    mm = np.lib.format.open_memmap(tmp_path / "x.npy", mode="w+", dtype=np.float64,
+                                   shape=x.shape)
+    mm[:] = x
+    result, copied = check_array(mm)
+    assert np.shares_memory(result, mm)
+    assert not copied
+
+
+def test_check_array_copies_once_when_needed():
+    x = np.random.default_rng(0).normal(size=(20, 3))
+
+    for source in (x.tolist(), np.asfortranarray(x), x.astype(np.float32),
+                   pd.DataFrame(x)):
+        result, copied = check_array(source)
+        assert copied
+        assert result.flags.c_contiguous
+        assert result.dtype == np.float64
+        np.testing.assert_allclose(result, x, rtol=1e-6)
+
+    result, copied = check_array(x.astype(np.float32), dtype=np.float32)
+    assert not copied
+
+    with pytest.raises(ValueError):
+        check_array(np.zeros(5))
+
+
+def test_fit_accepts_any_input_type():
+    x, _ = make_moons(n_samples=100, noise=0.05, random_state=42)
+    expected = DBSCAN(eps=0.2, min_samples=5).fit(x)
+    assert not expected.input_copied_
+
+    for source in (x.tolist(), np.asfortranarray(x), x[::1, :], pd.DataFrame(x)):
+        model = DBSCAN(eps=0.2, min_samples=5).fit(source)
+        np.testing.assert_array_equal(model.labels_, expected.labels_)
+
+    strided = np.repeat(x, 2, axis=1)[:, ::2]
+    model = DBSCAN(eps=0.2, min_samples=5).fit(strided)
+    assert model.input_copied_
+    np.testing.assert_array_equal(model.labels_, expected.labels_)
+
+
+def _peak(func, *args, **kwargs):
+    tracemalloc.start()
+    result = func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def test_check_array_converts_in_one_step():
+    x = np.arange(200_000, dtype=np.int64).reshape(-1, 2)
+
+    for source in (x.tolist(), np.asfortranarray(x)):
+        # a single direct conversion is the floor (for lists it includes
+        # NumPy's own parsing overhead)
+        _, floor = _peak(np.array, source, dtype=np.float64)
+        (result, copied), peak = _peak(check_array, source)
+
+        assert copied
+        assert result.flags.c_contiguous
+        assert peak < floor + 0.2 * result.nbytes
+
+
+def test_fit_accepts_empty_input():
+    model = DBSCAN(eps=0.5, min_samples=5).fit([])
+
+    assert model.labels_.shape == (0,)
+    assert model.cluster_summary_["n_clusters"] == 0